@@ -0,0 +1,129 @@
+import json
+import random
+import hashlib
+import pandas as pd
+from datetime import datetime, timedelta
+
+TITLES = [
+    'Product Designer', 'UX Designer', 'Interaction Designer', 'Visual Designer',
+    'Frontend Developer', 'Software Engineer', 'Full Stack Engineer', 'UX Engineer',
+    'UI Developer', 'Mobile Developer', 'Graphic Designer', 'Illustrator', 'Web Designer',
+]
+TITLE_PREFIXES = ['', '', '', 'Junior ', 'Associate ', 'Senior ', 'Sr. ', 'Staff ', 'Lead ', 'Principal ']
+TITLE_SUFFIXES = ['', '', '', ' Intern', ' II', ', Design Systems', ' (React)']
+
+COMPANIES = [
+    'Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Hooli', 'Vandelay Industries',
+    'Stark Digital', 'Wayne Enterprises', 'Soylent', 'Tyrell Systems', 'Cyberdyne', 'Wonka Studio',
+]
+LOCATIONS = [
+    "New York, NY", "Seattle, WA", "San Francisco, CA", "San Jose, CA", "Austin, TX",
+    "Boston, MA", "Los Angeles, CA", "Chicago, IL", "Denver, CO", "Redmond, WA",
+]
+QUERIES = ['product designer', 'ux designer', 'frontend developer', 'full stack', 'illustrator']
+
+HEADERS = ['About the role', 'What you will do', 'Requirements', 'Nice to have', 'Benefits', 'About us']
+SKILLS = [
+    'React', 'TypeScript', 'JavaScript', 'HTML', 'CSS', 'Figma', 'Sketch', 'Node.js',
+    'Swift', 'Kotlin', 'Photoshop', 'Illustrator', 'Webflow', 'GraphQL', 'Python',
+]
+WORDS = (
+    'design build ship collaborate product team users research prototype iterate '
+    'system component accessible responsive performance scalable customer experience '
+    'data platform mobile web interface feature quality review mentor roadmap '
+    'stakeholder deliver improve own drive craft detail visual motion brand'
+).split()
+BULLETS = ['* ', '- ', '• ', '◦ ', '+ ', '\\- ', '1. ']
+HTML_TAGS = ['<br>', '<b>', '</b>', '<p>', '</p>', '<li>', '<span class="x">']
+
+
+def _sentence(rng: random.Random, n_words: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(n_words)]
+    if rng.random() < 0.3:
+        words[rng.randrange(n_words)] = rng.choice(SKILLS)
+    if rng.random() < 0.15:
+        words.insert(rng.randrange(n_words), rng.choice(HTML_TAGS))
+    return " ".join(words).capitalize() + "."
+
+
+def generate_description(rng: random.Random, n_words: int = 300) -> str:
+    """
+    Builds a markdown job description of roughly `n_words` words with the
+    quirks jobspy descriptions have: bold and # headers, mixed bullet styles,
+    escaped characters, stray HTML and CRLF line endings.
+    """
+    lines = []
+    words = 0
+    while words < n_words:
+        header = rng.choice(HEADERS)
+        lines.append(f"**{header}**" if rng.random() < 0.6 else f"## {header}")
+        if rng.random() < 0.5:
+            paragraph = [_sentence(rng, rng.randint(8, 20)) for _ in range(rng.randint(1, 3))]
+            lines.append(" ".join(paragraph))
+            words += sum(len(s.split()) for s in paragraph)
+        bullet = rng.choice(BULLETS)
+        for _ in range(rng.randint(2, 6)):
+            item = _sentence(rng, rng.randint(4, 12))
+            lines.append(bullet + item)
+            words += len(item.split())
+        lines.append("")
+        if rng.random() < 0.2:
+            lines.append("")
+    newline = "\r\n" if rng.random() < 0.3 else "\n"
+    return newline.join(lines)
+
+
+def generate_jobs(n_rows: int = 1000, description_words: int = 300, seed: int = 0,
+                  with_classification: bool = False) -> pd.DataFrame:
+    """
+    Generates a seeded, jobspy-shaped DataFrame of synthetic job postings.
+
+    Args:
+        n_rows: Number of rows to generate.
+        description_words: Approximate word count of each description.
+        seed: RNG seed; the same arguments always produce the same frame.
+        with_classification: Also add the AI Worker output columns
+            (role_scores, seniority_scores, skills, summary) as JSON strings.
+
+    Returns:
+        DataFrame with the columns scrape_all_jobs() produces.
+    """
+    rng = random.Random(seed)
+    base_date = datetime(2025, 1, 1)
+    rows = []
+
+    for i in range(n_rows):
+        title = rng.choice(TITLE_PREFIXES) + rng.choice(TITLES) + rng.choice(TITLE_SUFFIXES)
+        company = rng.choice(COMPANIES)
+        location = rng.choice(LOCATIONS)
+        site = rng.choice(["linkedin", "indeed"])
+        job_id = hashlib.sha256(f"{seed}|{i}".encode("utf-8")).hexdigest()
+
+        row = {
+            "id": job_id,
+            "site": site,
+            "job_url": f"https://www.{site}.com/jobs/view/{i}",
+            "job_url_direct": f"https://careers.example.com/{i}" if rng.random() < 0.5 else None,
+            "title": title,
+            "company": company,
+            "company_logo": f"https://logo.example.com/{company.lower().replace(' ', '-')}.png",
+            "location": location,
+            "date_posted": (base_date + timedelta(days=rng.randint(0, 60))).strftime("%Y-%m-%d"),
+            "job_type": rng.choice(["fulltime", "internship", "contract", None]),
+            "is_remote": rng.random() < 0.2,
+            "description": generate_description(rng, description_words) if rng.random() > 0.02 else None,
+            "scraped_at": base_date.isoformat(),
+            "source_query": rng.choice(QUERIES),
+            "source_location": location,
+        }
+
+        if with_classification:
+            level = rng.choice(["intern", "entry", "mid and above", "unknown"])
+            row["role_scores"] = json.dumps({"ux_designer": round(rng.random(), 2), "software_engineer": round(rng.random(), 2)})
+            row["seniority_scores"] = json.dumps({k: int(k == level) for k in ["intern", "entry", "mid and above", "unknown"]})
+            row["skills"] = json.dumps(rng.sample(SKILLS, 3))
+            row["summary"] = _sentence(rng, 30)
+
+        rows.append(row)
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,236 @@
+"""
+Microbenchmarks for the pipeline's hot functions.
+
+Usage:
+    python -m benchmarks.run                         # 1k and 10k rows
+    python -m benchmarks.run --rows 1000,100000
+    python -m benchmarks.run --save benchmarks/baseline.json
+    python -m benchmarks.run --compare benchmarks/baseline.json
+"""
+import io
+import sys
+import csv
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from benchmarks.corpus import generate_jobs
+
+DEFAULT_ROWS = [1000, 10000]
+DEFAULT_TOLERANCE = 0.20  # flag a regression if throughput drops by more than 20%
+MIN_REPEAT_SECONDS = 0.2  # each timed repeat loops the call at least this long
+
+
+# -------------------------------------------
+# Benchmarks
+# -------------------------------------------
+# Each benchmark returns (setup, fn): setup(df) builds the input outside the
+# timed region, fn(input) is the code under test. Imports happen here so a
+# module that cannot be imported only skips its own benchmark.
+
+def bench_clean_markdown():
+    from utils.markdown_cleaner import clean_markdown
+    return (
+        lambda df: df["description"].fillna(""),
+        lambda s: s.apply(clean_markdown),
+    )
+
+
+def bench_truncate_description():
+    from utils.classifier_ai_pipeline import truncate_description
+    return (
+        lambda df: df["description"].fillna(""),
+        lambda s: s.apply(truncate_description),
+    )
+
+
+def bench_classify_and_filter_jobs():
+    from utils.classifier import classify_and_filter_jobs
+    return (
+        lambda df: df.copy(),
+        classify_and_filter_jobs,
+    )
+
+
+def bench_make_unique_id():
+    from utils.scraper import make_unique_id
+
+    def setup(df):
+        df = df.copy()
+        df["job_title"] = df["title"]
+        df["company_name"] = df["company"]
+        return df
+
+    return setup, lambda df: df.apply(make_unique_id, axis=1)
+
+
+def bench_transform_row():
+    from utils.upload_jobs import transform_row
+
+    # upload_jobs_from_csv feeds transform_row csv.DictReader rows (all strings)
+    def setup(df):
+        buf = io.StringIO()
+        df.to_csv(buf, index=False)
+        buf.seek(0)
+        return list(csv.DictReader(buf))
+
+    return setup, lambda rows: [transform_row(row) for row in rows]
+
+
+BENCHMARKS = {
+    "clean_markdown": bench_clean_markdown,
+    "truncate_description": bench_truncate_description,
+    "classify_and_filter_jobs": bench_classify_and_filter_jobs,
+    "make_unique_id": bench_make_unique_id,
+    "transform_row": bench_transform_row,
+}
+
+
+# -------------------------------------------
+# Runner
+# -------------------------------------------
+def _timed_loops(setup, fn, df, loops):
+    """Runs fn `loops` times on fresh inputs; only the calls are timed."""
+    inputs = [setup(df) for _ in range(loops)]
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        for data in inputs:
+            fn(data)
+        return time.perf_counter() - start
+
+
+def time_one(setup, fn, df, repeat):
+    """
+    Per-call time as the best of `repeat` repeats. Like timeit's autorange,
+    each repeat loops the call until it takes at least MIN_REPEAT_SECONDS, so
+    fast functions are not measured on a single noisy call. Then one extra
+    run under tracemalloc for peak memory.
+    """
+    loops = 1
+    while True:
+        elapsed = _timed_loops(setup, fn, df, loops)
+        if elapsed >= MIN_REPEAT_SECONDS:
+            break
+        loops = max(loops * 2, int(loops * MIN_REPEAT_SECONDS / max(elapsed, 1e-9) * 1.2))
+
+    timings = [elapsed / loops]
+    for _ in range(repeat - 1):
+        timings.append(_timed_loops(setup, fn, df, loops) / loops)
+
+    data = setup(df)
+    tracemalloc.start()
+    with redirect_stdout(io.StringIO()):
+        fn(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        "rows": len(df),
+        "loops": loops,
+        "seconds": best,
+        "seconds_per_row": best / len(df),
+        "rows_per_sec": len(df) / best if best > 0 else None,
+        "peak_mem_bytes": peak,
+    }
+
+
+def run_benchmarks(rows_list, names, description_words, seed, repeat):
+    results = {}
+    for n_rows in rows_list:
+        df = generate_jobs(n_rows, description_words=description_words, seed=seed, with_classification=True)
+        print(f"\nCorpus: {n_rows} rows, ~{description_words} words/description (seed {seed})")
+
+        for name in names:
+            key = f"{name}@{n_rows}"
+            try:
+                setup, fn = BENCHMARKS[name]()
+            except Exception as e:
+                print(f"  ⚠️ {name}: skipped ({e})")
+                results[key] = {"rows": n_rows, "skipped": str(e)}
+                continue
+
+            r = time_one(setup, fn, df, repeat)
+            results[key] = r
+            print(f"  ✓ {name}: {r['seconds']:.4f}s ×{r['loops']}, {r['rows_per_sec']:,.0f} rows/s, "
+                  f"peak {r['peak_mem_bytes'] / 1e6:.1f} MB")
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Prints a comparison against a saved baseline. Returns the list of regressed keys."""
+    regressions = []
+    print(f"\nComparison against baseline (tolerance {tolerance:.0%}):")
+    for key, r in results.items():
+        base = baseline.get("results", {}).get(key)
+        if not base or "skipped" in r or "skipped" in base or "seconds_per_row" not in base:
+            continue
+        # Compared on the per-row minimum; throughput change = base/new - 1
+        change = base["seconds_per_row"] / r["seconds_per_row"] - 1
+        mem_change = r["peak_mem_bytes"] / base["peak_mem_bytes"] - 1 if base["peak_mem_bytes"] else 0.0
+        regressed = change < -tolerance or mem_change > tolerance
+        marker = "✗" if regressed else "✓"
+        print(f"  {marker} {key}: throughput {change:+.1%}, peak memory {mem_change:+.1%}")
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the pipeline's hot functions.")
+    parser.add_argument("--rows", default=",".join(str(n) for n in DEFAULT_ROWS),
+                        help="Comma-separated corpus sizes (default: 1000,10000)")
+    parser.add_argument("--only", default=",".join(BENCHMARKS),
+                        help="Comma-separated benchmark names to run")
+    parser.add_argument("--description-words", type=int, default=300)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="Write results as a JSON baseline to this path")
+    parser.add_argument("--compare", help="Compare against a JSON baseline; exits 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows_list = [int(n) for n in args.rows.split(",")]
+    names = [n.strip() for n in args.only.split(",")]
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"✗ Unknown benchmarks: {', '.join(unknown)}")
+        return 2
+
+    results = run_benchmarks(rows_list, names, args.description_words, args.seed, args.repeat)
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "description_words": args.description_words,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.save:
+        with open(args.save, "w", encoding="utf8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Saved baseline to {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.tolerance):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
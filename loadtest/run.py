@@ -0,0 +1,210 @@
+"""
+Offline end-to-end load test of main.py.
+
+scrape_jobs is replaced by a replayer over the synthetic benchmark corpus,
+and the classifier Worker and Supabase are served by local stubs
+(see loadtest/stubs.py), so nothing leaves 127.0.0.1.
+
+Usage:
+    python -m loadtest.run --cells 20 --rows-per-cell 100
+    python -m loadtest.run --cells 50 --worker-latency 0.2 --worker-error-rate 0.05 --runs 2
+    python -m loadtest.run --report load_report.json
+"""
+import os
+import sys
+import json
+import time
+import zlib
+import argparse
+import tempfile
+import pandas as pd
+from contextlib import redirect_stdout
+from io import StringIO
+
+from benchmarks.corpus import generate_jobs
+from loadtest.stubs import start_stub_worker, start_stub_postgrest
+
+# supabase-py only accepts JWT-shaped keys; the stub never checks it
+STUB_SUPABASE_KEY = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoic2VydmljZV9yb2xlIn0.c3R1Yg"
+
+def make_replayer(rows_per_cell, description_words, seed, churn, served):
+    """
+    Returns a scrape_jobs stand-in that serves corpus rows, seeded per cell,
+    so every run replays the same postings. From the second run on
+    (served["run"] > 0), a `churn` fraction of each cell's rows is replaced
+    with fresh postings. The number of rows served is accumulated in served["rows"].
+    """
+    def replay_scrape_jobs(site_name, search_term, location, results_wanted=250, **kwargs):
+        site = site_name[0]
+        cell_seed = seed + zlib.crc32(f"{site}|{location}|{search_term}".encode("utf-8"))
+        n_rows = min(rows_per_cell, results_wanted)
+        df = generate_jobs(n_rows, description_words=description_words, seed=cell_seed)
+
+        fresh = int(n_rows * churn) if served["run"] > 0 else 0
+        if fresh:
+            new_rows = generate_jobs(fresh, description_words=description_words,
+                                     seed=cell_seed + served["run"] * 7919)
+            df = pd.concat([df.iloc[:n_rows - fresh], new_rows], ignore_index=True)
+
+        df["site"] = site
+        df["location"] = location
+        served["rows"] += len(df)
+        return df.drop(columns=["scraped_at", "source_query", "source_location"])
+    return replay_scrape_jobs
+
+
+def summarize_latencies(latencies):
+    if not latencies:
+        return {"count": 0}
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1],
+    }
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Offline end-to-end load test of main.py.")
+    parser.add_argument("--cells", type=int, default=20, help="Scrape calls per run; the same cells every run")
+    parser.add_argument("--rows-per-cell", type=int, default=100)
+    parser.add_argument("--description-words", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=1, help="Later runs see earlier runs' jobs as existing")
+    parser.add_argument("--churn", type=float, default=0.2,
+                        help="Fraction of each cell's rows that are fresh postings in runs after the first")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--worker-latency", type=float, default=0.0, help="Seconds per Worker request")
+    parser.add_argument("--worker-latency-per-job", type=float, default=0.0, help="Extra seconds per job in a batch")
+    parser.add_argument("--worker-error-rate", type=float, default=0.0)
+    parser.add_argument("--worker-malformed-rate", type=float, default=0.0)
+    parser.add_argument("--verbose", action="store_true", help="Show the pipeline's own output")
+    parser.add_argument("--report", help="Write the load report as JSON to this path")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    worker, worker_url = start_stub_worker(
+        latency=args.worker_latency,
+        latency_per_job=args.worker_latency_per_job,
+        error_rate=args.worker_error_rate,
+        malformed_rate=args.worker_malformed_rate,
+        seed=args.seed,
+    )
+    db, db_url = start_stub_postgrest()
+
+    # Set before the pipeline modules are imported: the classifier reads
+    # AI_CLASSIFIER_URL at import time.
+    os.environ["AI_CLASSIFIER_URL"] = worker_url
+    os.environ["SUPABASE_URL"] = db_url
+    os.environ["SUPABASE_KEY"] = STUB_SUPABASE_KEY
+
+    import main as pipeline
+    import utils.scraper as scraper
+    import utils.scheduler as scheduler
+    from utils import metrics
+
+    served = {"rows": 0, "run": 0}
+    scraper.scrape_jobs = make_replayer(args.rows_per_cell, args.description_words, args.seed, args.churn, served)
+    scraper.RATE_LIMIT_SECONDS = 0
+
+    # A fixed plan instead of the adaptive scheduler, which would explore
+    # unseen cells first and give every run different cells
+    fixed_plan = [
+        {"site": site, "location": location, "query": q, "results_wanted": 250, "hours_old": 720}
+        for site, location, q in scraper.all_cells()[:args.cells]
+    ]
+    scheduler.plan_cells = lambda history, cells, budget=None, now=None: fixed_plan
+
+    # Pay the one-time imports and Supabase client construction up front, so
+    # run 1's first stages measure the pipeline and not module loading
+    import utils.classifier, utils.markdown_cleaner, utils.classifier_ai_pipeline  # noqa: F401
+    from utils.upload_jobs import get_supabase
+    get_supabase()
+
+    # main.py reads and writes ./jobs/, so run it in a scratch directory
+    workdir = tempfile.mkdtemp(prefix="loadtest_")
+    os.makedirs(os.path.join(workdir, "jobs"))
+    cwd = os.getcwd()
+    os.chdir(workdir)
+
+    runs = []
+    try:
+        for i in range(args.runs):
+            served["rows"] = 0
+            served["run"] = i
+            rows_before = len(db.tables["jobs"])
+            print(f"Run {i + 1}/{args.runs}: {args.cells} cells × {args.rows_per_cell} rows...")
+
+            start = time.perf_counter()
+            if args.verbose:
+                pipeline.main([])
+            else:
+                with redirect_stdout(StringIO()):
+                    pipeline.main([])
+            wall = time.perf_counter() - start
+
+            stages = {}
+            for s in metrics.report()["stages"]:
+                stage = stages.setdefault(s["stage"], {"seconds": 0.0, "status": "ok"})
+                stage["seconds"] += s["seconds"]
+                if s["status"] != "ok":
+                    stage["status"] = s["status"]
+                    stage["error"] = s.get("error")
+
+            scraped_rows = served["rows"]
+            runs.append({
+                "wall_seconds": wall,
+                "scraped_rows": scraped_rows,
+                "rows_per_sec": scraped_rows / wall if wall > 0 else None,
+                "new_rows_in_db": len(db.tables["jobs"]) - rows_before,
+                "stages": stages,
+            })
+            time.sleep(1)  # main.py timestamps outputs per second
+    finally:
+        os.chdir(cwd)
+        worker.shutdown()
+        db.shutdown()
+
+    report = {
+        "config": vars(args),
+        "workdir": workdir,
+        "runs": runs,
+        "worker": {
+            **{k: v for k, v in worker.stats.items() if k != "latencies"},
+            "latency": summarize_latencies(worker.stats["latencies"]),
+        },
+        "postgrest": {
+            **{k: v for k, v in db.stats.items() if k != "latencies"},
+            "upsert_latency": summarize_latencies(db.stats["latencies"]),
+            "rows_in_table": len(db.tables["jobs"]),
+        },
+    }
+
+    for i, r in enumerate(runs, 1):
+        print(f"\nRun {i}: {r['wall_seconds']:.2f}s end-to-end, {r['rows_per_sec']:,.0f} scraped rows/s, "
+              f"{r['new_rows_in_db']} new rows in jobs")
+        for stage, st in r["stages"].items():
+            marker = "✓" if st["status"] == "ok" else "✗"
+            error = f"  {st['error']}" if st["status"] != "ok" else ""
+            print(f"  {marker} {stage:<20} {st['seconds']:8.3f}s{error}")
+
+    w = report["worker"]
+    print(f"\nWorker: {w['requests']} requests, {w['errors']} errors, {w['malformed']} malformed, "
+          f"mean latency {w['latency'].get('mean', 0):.3f}s")
+    p = report["postgrest"]
+    print(f"PostgREST: {p['selects']} selects, {p['upserts']} upserts, {p['rows_upserted']} rows upserted")
+
+    if args.report:
+        with open(args.report, "w", encoding="utf8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n✓ Saved load report to {args.report}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
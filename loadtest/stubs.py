@@ -0,0 +1,185 @@
+"""
+Local HTTP stand-ins for the classifier Worker and Supabase's PostgREST API.
+
+Both servers run on 127.0.0.1 in a background thread and keep simple
+request counters on the server object for the load report.
+"""
+import json
+import time
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+SENIORITY_LEVELS = ["intern", "entry", "mid and above", "unknown"]
+
+
+class _QuietHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        return json.loads(body) if body else None
+
+    def _send(self, status, body, content_type="application/json"):
+        data = body if isinstance(body, bytes) else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+# -------------------------------------------
+# Classifier Worker
+# -------------------------------------------
+class StubWorkerHandler(_QuietHandler):
+    """Mimics ai-classifier-worker: POST { jobs: [...] } → { results: [...] }."""
+
+    def do_POST(self):
+        server = self.server
+        started = time.perf_counter()
+
+        try:
+            payload = self._read_json()
+        except json.JSONDecodeError:
+            payload = None
+        jobs = payload.get("jobs") if isinstance(payload, dict) else None
+        if not isinstance(jobs, list):
+            self._send(400, {"error": "Expected { jobs: [...] }"})
+            return
+
+        time.sleep(server.latency + server.latency_per_job * len(jobs))
+
+        with server.lock:
+            roll = server.rng.random()
+            server.stats["requests"] += 1
+            server.stats["jobs"] += len(jobs)
+
+        if roll < server.error_rate:
+            with server.lock:
+                server.stats["errors"] += 1
+            self._send(500, {"error": "stub worker: injected failure"})
+        elif roll < server.error_rate + server.malformed_rate:
+            with server.lock:
+                server.stats["malformed"] += 1
+            self._send(200, b'{"results": [{"role_scores": {"other": 1}, ')
+        else:
+            self._send(200, {"results": [self._classify(job) for job in jobs]})
+
+        with server.lock:
+            server.stats["latencies"].append(time.perf_counter() - started)
+
+    def _classify(self, job):
+        title = str(job.get("title", "")).lower()
+        with self.server.lock:
+            level = "intern" if "intern" in title else self.server.rng.choice(SENIORITY_LEVELS)
+        return {
+            "role_scores": {"software_engineer": 1 if "engineer" in title or "developer" in title else 0,
+                            "ux_designer": 1 if "design" in title else 0,
+                            "other": 0},
+            "seniority_scores": {k: int(k == level) for k in SENIORITY_LEVELS},
+            "summary": f"Stub summary for {job.get('title', '')}.",
+            "skills": ["React", "Figma"],
+        }
+
+
+def start_stub_worker(latency=0.0, latency_per_job=0.0, error_rate=0.0, malformed_rate=0.0, seed=0):
+    """
+    Starts the stub classifier Worker.
+
+    Args:
+        latency: Fixed seconds added to every request.
+        latency_per_job: Extra seconds per job in the batch (the real Worker is sequential).
+        error_rate: Fraction of requests answered with HTTP 500.
+        malformed_rate: Fraction of requests answered with truncated JSON.
+        seed: RNG seed for failure injection and fake seniority scores.
+
+    Returns:
+        (server, url); call server.shutdown() when done.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWorkerHandler)
+    server.latency = latency
+    server.latency_per_job = latency_per_job
+    server.error_rate = error_rate
+    server.malformed_rate = malformed_rate
+    server.rng = random.Random(seed)
+    server.lock = threading.Lock()
+    server.stats = {"requests": 0, "jobs": 0, "errors": 0, "malformed": 0, "latencies": []}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/"
+
+
+# -------------------------------------------
+# Supabase PostgREST
+# -------------------------------------------
+class StubPostgrestHandler(_QuietHandler):
+    """
+    Serves /rest/v1/<table> with just enough PostgREST for upload_jobs:
+    GET ?select=cols and POST upserts merged on `id`.
+    """
+
+    def _table(self):
+        parsed = urlparse(self.path)
+        parts = parsed.path.strip("/").split("/")
+        if len(parts) != 3 or parts[:2] != ["rest", "v1"]:
+            return None, parsed
+        return self.server.tables.setdefault(parts[2], {}), parsed
+
+    def do_GET(self):
+        table, parsed = self._table()
+        if table is None:
+            self._send(404, {"message": "not found"})
+            return
+
+        columns = parse_qs(parsed.query).get("select", ["*"])[0]
+        with self.server.lock:
+            rows = list(table.values())
+            self.server.stats["selects"] += 1
+
+        if columns != "*":
+            wanted = [c.strip() for c in columns.split(",")]
+            rows = [{c: row.get(c) for c in wanted} for row in rows]
+        self._send(200, rows)
+
+    def do_POST(self):
+        started = time.perf_counter()
+        table, _ = self._table()
+        if table is None:
+            self._send(404, {"message": "not found"})
+            return
+
+        rows = self._read_json()
+        rows = rows if isinstance(rows, list) else [rows]
+        if any("id" not in row for row in rows):
+            self._send(400, {"message": "upsert rows must include id"})
+            return
+
+        with self.server.lock:
+            for row in rows:
+                table.setdefault(row["id"], {}).update(row)
+            self.server.stats["upserts"] += 1
+            self.server.stats["rows_upserted"] += len(rows)
+            self.server.stats["latencies"].append(time.perf_counter() - started)
+
+        if "return=minimal" in (self.headers.get("Prefer") or ""):
+            self._send(201, b"")
+        else:
+            self._send(201, rows)
+
+
+def start_stub_postgrest():
+    """
+    Starts the stub PostgREST server with an empty `jobs` table.
+
+    Returns:
+        (server, url); server.tables["jobs"] maps id → row.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPostgrestHandler)
+    server.tables = {"jobs": {}}
+    server.lock = threading.Lock()
+    server.stats = {"selects": 0, "upserts": 0, "rows_upserted": 0, "latencies": []}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
@@ -1,73 +1,143 @@
 import csv
+import os
 import sys
-import pandas as pd
+import glob
+import argparse
 from datetime import datetime
-from utils.scraper import scrape_all_jobs
-from utils.classifier import classify_and_filter_jobs
-from utils.markdown_cleaner import clean_markdown
-from utils.classifier_ai_pipeline import classify_jobs_ai
-from utils.upload_jobs import upload_jobs_from_csv, get_existing_job_ids, upload_unclassified_jobs_df
+from utils import metrics
 
+# pandas, jobspy and the Supabase client are imported inside the stages that
+# need them, so e.g. `upload` or `--help` never pay for the scraper stack.
 
-def main():
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    skip_scrape = len(sys.argv) > 1 and sys.argv[1] == "skip"
+JOBS_DIR = "./jobs"
+CLASSIFIED_PATH = f"{JOBS_DIR}/classified_jobs.csv"
 
-    # -------------------------
-    # Step 1 — Scrape or Load Existing
-    # -------------------------
-    if skip_scrape:
-        print("Skipping scrape. Loading most recent raw_jobs file...")
+STAGES = [
+    "scrape", "load_checkpoint", "separate", "update_existing", "filter_title",
+    "clean_markdown", "classify_ai", "dedupe", "upload",
+]
 
-        import glob
-        files = sorted(glob.glob("./jobs/raw_jobs_*.csv"))
-        if not files:
-            print("✗ No raw_jobs_*.csv found. Cannot skip scrape.")
-            return
 
-        last_raw = files[-1]
-        scraped = pd.read_csv(last_raw)
-        print(f"✓ Loaded {len(scraped)} jobs from {last_raw}")
+# -------------------------
+# Checkpoints
+# -------------------------
+def latest_checkpoint(pattern):
+    files = sorted(glob.glob(f"{JOBS_DIR}/{pattern}"))
+    return files[-1] if files else None
 
-    else:
-        try:
-            print("Starting scrape...")
-            scraped = scrape_all_jobs()
 
-            if scraped.empty:
-                print("⚠️  No jobs scraped. Exiting.")
-                return
+def load_checkpoint(path, pattern):
+    """Loads `path`, or the most recent file matching `pattern` in ./jobs/."""
+    import pandas as pd
 
-            print(f"✓ Scraped: {len(scraped)} jobs")
+    path = path or latest_checkpoint(pattern)
+    if not path:
+        print(f"✗ No {pattern} found in {JOBS_DIR}.")
+        return None
 
-            raw_path = f"./jobs/raw_jobs_{timestamp}.csv"
-            scraped.to_csv(
-                raw_path,
-                quoting=csv.QUOTE_NONNUMERIC,
-                escapechar="\\",
-                index=False,
-            )
-            print(f"✓ Saved raw data to {raw_path}")
+    with metrics.stage("load_checkpoint") as s:
+        df = pd.read_csv(path)
+        s["rows_out"] = len(df)
+    print(f"✓ Loaded {len(df)} jobs from {path}")
+    return df
 
-        except Exception as e:
-            print(f"✗ Scraping failed: {e}")
-            return
+
+def history_for(df):
+    """
+    Returns the cell history if `df` came from the most recent scrape run,
+    so yields can be recorded against it; otherwise None.
+    """
+    from utils.scheduler import load_history
+
+    if "scrape_run" not in df.columns:
+        print("⚠️ Checkpoint has no scrape_run column; cell yields not recorded.")
+        return None
+
+    history = load_history()
+    if history["runs"] == 0 or not (df["scrape_run"] == history["runs"]).all():
+        print("⚠️ Checkpoint is not from the latest scrape run; cell yields not recorded.")
+        return None
+    return history
+
+
+# -------------------------
+# Stages
+# -------------------------
+def scrape_stage(timestamp):
+    """
+    Step 1 — Scrape. Saves raw_jobs_<timestamp>.csv.
+    Returns (scraped, history), or (None, None) if nothing was scraped.
+    """
+    from utils.scraper import scrape_all_jobs, all_cells
+    from utils.scheduler import load_history, save_history, start_run, plan_cells
+
+    try:
+        print("Starting scrape...")
+        with metrics.stage("scrape") as s:
+            history = load_history()
+            budget = os.getenv("SCRAPE_CELL_BUDGET")
+            plan = plan_cells(history, all_cells(), budget=int(budget) if budget else None)
+            start_run(history)
+            scraped = scrape_all_jobs(plan, history)
+            save_history(history)
+            s["rows_out"] = len(scraped)
+
+        if scraped.empty:
+            print("⚠️  No jobs scraped. Exiting.")
+            return None, None
+
+        print(f"✓ Scraped: {len(scraped)} jobs")
+
+        # Lets filter/classify run from checkpoints still record cell yields
+        scraped["scrape_run"] = history["runs"]
+
+        raw_path = f"{JOBS_DIR}/raw_jobs_{timestamp}.csv"
+        scraped.to_csv(
+            raw_path,
+            quoting=csv.QUOTE_NONNUMERIC,
+            escapechar="\\",
+            index=False,
+        )
+        print(f"✓ Saved raw data to {raw_path}")
+        return scraped, history
+
+    except Exception as e:
+        print(f"✗ Scraping failed: {e}")
+        return None, None
+
+
+def filter_stage(scraped, timestamp, history=None):
+    """
+    Steps 2–5 — Separate new from existing jobs, update the existing ones,
+    filter the new ones by title and clean their markdown.
+    Saves filtered_jobs_<timestamp>.csv and returns it, or None to stop.
+    """
+    from utils.classifier import classify_and_filter_jobs
+    from utils.markdown_cleaner import clean_markdown
+    from utils.upload_jobs import get_existing_job_ids, upload_unclassified_jobs_df
+    from utils.scheduler import save_history, record_yields
 
     # -------------------------
     # Step 2 — Separate new and existing jobs
     # -------------------------
     try:
         print("\nSeparating new and existing jobs...")
-        existing_job_ids = get_existing_job_ids()
-        
-        new_jobs = scraped[~scraped['id'].isin(existing_job_ids)]
-        existing_jobs = scraped[scraped['id'].isin(existing_job_ids)]
-        
+        with metrics.stage("separate", rows_in=len(scraped)) as s:
+            existing_job_ids = get_existing_job_ids()
+
+            new_jobs = scraped[~scraped['id'].isin(existing_job_ids)]
+            existing_jobs = scraped[scraped['id'].isin(existing_job_ids)]
+            s["rows_out"] = len(new_jobs)
+
         print(f"✓ Found {len(new_jobs)} new jobs and {len(existing_jobs)} existing jobs.")
 
+        if history is not None:
+            metrics.update_scrape_cells("new", record_yields(history, new_jobs, "new"))
+            save_history(history)
+
     except Exception as e:
         print(f"✗ Failed to separate jobs: {e}")
-        return
+        return None
 
     # -------------------------
     # Step 3 — Update existing jobs
@@ -75,49 +145,77 @@ def main():
     if not existing_jobs.empty:
         try:
             print("\nUpdating existing jobs in Supabase...")
-            upload_unclassified_jobs_df(existing_jobs)
+            with metrics.stage("update_existing", rows_in=len(existing_jobs)) as s:
+                upload_unclassified_jobs_df(existing_jobs)
+                s["rows_out"] = len(existing_jobs)
             print(f"✓ Updated {len(existing_jobs)} existing jobs.")
         except Exception as e:
             print(f"✗ Failed to update existing jobs: {e}")
             # Non-fatal, we can continue with the new jobs
-    
+
     # -------------------------
     # Step 4 — Filter by title
     # -------------------------
     if new_jobs.empty:
         print("\nNo new jobs to process. Exiting.")
-        return
-        
+        return None
+
     try:
         print("\nFiltering new jobs by title...")
-        classified = classify_and_filter_jobs(new_jobs)
+        with metrics.stage("filter_title", rows_in=len(new_jobs)) as s:
+            filtered = classify_and_filter_jobs(new_jobs)
+            s["rows_out"] = len(filtered)
     except Exception as e:
         print(f"✗ Filtering failed: {e}")
-        return
+        return None
 
     # -------------------------
     # Step 5 — Clean Markdown
     # -------------------------
     try:
         print("\nCleaning markdown...")
-        classified["description"] = classified["description"].fillna("").apply(clean_markdown)
-        print(f"✓ Cleaned {len(classified)} descriptions")
+        with metrics.stage("clean_markdown", rows_in=len(filtered)) as s:
+            filtered["description"] = filtered["description"].fillna("").apply(clean_markdown)
+            s["rows_out"] = len(filtered)
+        print(f"✓ Cleaned {len(filtered)} descriptions")
+
+        filtered_path = f"{JOBS_DIR}/filtered_jobs_{timestamp}.csv"
+        filtered.to_csv(filtered_path, index=False)
+        print(f"✓ Saved filtered data to {filtered_path}")
+        return filtered
+
     except Exception as e:
         print(f"✗ Cleaning failed: {e}")
-        return
+        return None
+
+
+def classify_stage(filtered, timestamp, history=None):
+    """
+    Steps 6–7 — Classify with the AI Worker and deduplicate.
+    Saves classified_jobs_<timestamp>.csv and classified_jobs.csv and
+    returns the classified jobs, or None to stop.
+    """
+    from utils.classifier_ai_pipeline import classify_jobs_ai
+    from utils.scheduler import save_history, record_yields
 
     # -------------------------
     # Step 6 — Classify using AI Worker
     # -------------------------
     try:
         print("\nClassifying jobs with AI Worker...")
-        classified = classify_jobs_ai(classified, batch_size=10)
+        with metrics.stage("classify_ai", rows_in=len(filtered)) as s:
+            classified = classify_jobs_ai(filtered, batch_size=10)
+            s["rows_out"] = len(classified)
 
         print(f"✓ Classified {len(classified)} jobs")
 
+        if history is not None:
+            metrics.update_scrape_cells("kept", record_yields(history, classified, "kept"))
+            save_history(history)
+
     except Exception as e:
         print(f"✗ Classification failed: {e}")
-        return
+        return None
 
     # -------------------------
     # Step 7 — Deduplicate
@@ -125,31 +223,144 @@ def main():
     try:
         print("\nDeduplicating...")
         before = len(classified)
-        classified.drop_duplicates(subset=["id"], inplace=True)
+        with metrics.stage("dedupe", rows_in=before) as s:
+            classified.drop_duplicates(subset=["id"], inplace=True)
+            s["rows_out"] = len(classified)
         after = len(classified)
         print(f"✓ Deduped: {before} → {after} ({before - after} duplicates removed)")
 
-        classified_path = f"./jobs/classified_jobs_{timestamp}.csv"
+        classified_path = f"{JOBS_DIR}/classified_jobs_{timestamp}.csv"
         classified.to_csv(classified_path, index=False)
-        classified.to_csv("./jobs/classified_jobs.csv", index=False)
+        classified.to_csv(CLASSIFIED_PATH, index=False)
         print(f"✓ Saved classified data to {classified_path}")
+        return classified
 
     except Exception as e:
         print(f"✗ Deduplication/saving failed: {e}")
+        return None
+
+
+def upload_stage(path=CLASSIFIED_PATH):
+    """Step 8 — Upload classified jobs from `path` to Supabase."""
+    from utils.upload_jobs import upload_jobs_from_csv
+
+    if not os.path.exists(path):
+        print(f"✗ {path} not found. Nothing to upload.")
         return
 
-    # -------------------------
-    # Step 8 — Upload to Supabase
-    # -------------------------
     try:
         print("\nUploading to Supabase...")
-        upload_jobs_from_csv("./jobs/classified_jobs.csv")
-        print("✓ Upload complete")
+        with metrics.stage("upload") as s:
+            uploaded = upload_jobs_from_csv(path)
+            s["rows_in"] = s["rows_out"] = uploaded
+        print(f"✓ Uploaded {uploaded} jobs")
 
     except Exception as e:
         print(f"✗ Upload failed: {e}")
 
 
+# -------------------------
+# Commands
+# -------------------------
+def cmd_scrape(args, timestamp):
+    scrape_stage(timestamp)
+
+
+def cmd_filter(args, timestamp):
+    scraped = load_checkpoint(args.input, "raw_jobs_*.csv")
+    if scraped is not None:
+        filter_stage(scraped, timestamp, history_for(scraped))
+
+
+def cmd_classify(args, timestamp):
+    filtered = load_checkpoint(args.input, "filtered_jobs_*.csv")
+    if filtered is not None:
+        classify_stage(filtered, timestamp, history_for(filtered))
+
+
+def cmd_upload(args, timestamp):
+    upload_stage(args.input or CLASSIFIED_PATH)
+
+
+def cmd_run(args, timestamp):
+    if args.skip_scrape:
+        print("Skipping scrape. Loading most recent raw_jobs file...")
+        scraped = load_checkpoint(None, "raw_jobs_*.csv")
+        history = history_for(scraped) if scraped is not None else None
+    else:
+        scraped, history = scrape_stage(timestamp)
+    if scraped is None:
+        return
+
+    filtered = filter_stage(scraped, timestamp, history)
+    if filtered is None:
+        return
+
+    classified = classify_stage(filtered, timestamp, history)
+    if classified is None:
+        return
+
+    upload_stage(CLASSIFIED_PATH)
+
+
+def parse_args(argv):
+    # `python main.py` and `python main.py skip` predate the subcommands
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv = ["run", *argv]
+    elif argv[0] == "skip":
+        argv = ["run", "--skip-scrape", *argv[1:]]
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--profile", choices=STAGES, help="Run the named stage under cProfile")
+    common.add_argument("--prometheus-textfile", help="Also write run metrics as a Prometheus textfile here")
+    common.add_argument("--trace-memory", action="store_true",
+                        help="Record peak Python heap per stage with tracemalloc (slows the run)")
+
+    parser = argparse.ArgumentParser(description="Scrape, classify and upload jobs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    p = commands.add_parser("scrape", parents=[common], help="Scrape jobs to jobs/raw_jobs_<timestamp>.csv")
+    p.set_defaults(func=cmd_scrape)
+
+    p = commands.add_parser("filter", parents=[common],
+                            help="Separate new jobs, update existing ones, filter and clean the new ones")
+    p.add_argument("--input", help="Raw jobs CSV (default: most recent jobs/raw_jobs_*.csv)")
+    p.set_defaults(func=cmd_filter)
+
+    p = commands.add_parser("classify", parents=[common], help="Classify filtered jobs with the AI Worker")
+    p.add_argument("--input", help="Filtered jobs CSV (default: most recent jobs/filtered_jobs_*.csv)")
+    p.set_defaults(func=cmd_classify)
+
+    p = commands.add_parser("upload", parents=[common], help="Upload classified jobs to Supabase")
+    p.add_argument("--input", help=f"Classified jobs CSV (default: {CLASSIFIED_PATH})")
+    p.set_defaults(func=cmd_upload)
+
+    p = commands.add_parser("run", parents=[common], help="Run the whole pipeline (default)")
+    p.add_argument("--skip-scrape", action="store_true", help="Start from the most recent raw_jobs CSV")
+    p.set_defaults(func=cmd_run)
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    metrics.start_run(timestamp, track_memory=args.trace_memory, profile_stage=args.profile)
+
+    try:
+        args.func(args, timestamp)
+    finally:
+        metrics_path = f"{JOBS_DIR}/run_metrics_{timestamp}.json"
+        try:
+            data = metrics.write_report(metrics_path)
+            print(f"\n✓ Saved run metrics to {metrics_path}")
+            if args.prometheus_textfile:
+                metrics.write_prometheus(args.prometheus_textfile, data)
+                print(f"✓ Saved Prometheus metrics to {args.prometheus_textfile}")
+        except Exception as e:
+            print(f"⚠️ Failed to save run metrics: {e}")
+
+
 if __name__ == "__main__":
     try:
         main()
@@ -158,4 +369,4 @@ if __name__ == "__main__":
         sys.exit(1)
     except Exception as e:
         print(f"\n✗ Unexpected error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
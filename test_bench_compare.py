@@ -0,0 +1,60 @@
+import os
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from unittest.mock import patch
+from benchmarks import run
+
+
+def result(seconds_per_row, peak_mem_bytes=1000):
+    return {"rows": 1000, "seconds_per_row": seconds_per_row, "peak_mem_bytes": peak_mem_bytes}
+
+
+BASELINE = {"results": {
+    "clean_markdown@1000": result(1e-5),
+    "transform_row@1000": result(1e-5),
+    "make_unique_id@1000": {"rows": 1000, "skipped": "import failed"},
+    "classify_and_filter_jobs@1000": {"rows": 1000, "seconds": 0.01},  # older baseline format
+}}
+
+
+class TestBenchCompare(unittest.TestCase):
+
+    def compare(self, results, tolerance=0.2):
+        with redirect_stdout(StringIO()):
+            return run.compare(results, BASELINE, tolerance)
+
+    def test_within_tolerance_passes(self):
+        self.assertEqual(self.compare({
+            "clean_markdown@1000": result(1.1e-5),
+            "transform_row@1000": result(0.9e-5, peak_mem_bytes=1150),
+        }), [])
+
+    def test_flags_throughput_drop_and_memory_rise(self):
+        self.assertEqual(self.compare({
+            "clean_markdown@1000": result(1.5e-5),
+            "transform_row@1000": result(1e-5, peak_mem_bytes=1500),
+        }), ["clean_markdown@1000", "transform_row@1000"])
+
+    def test_skips_unmatched_entries(self):
+        self.assertEqual(self.compare({
+            "clean_markdown@1000": {"rows": 1000, "skipped": "import failed"},
+            "make_unique_id@1000": result(1e-3),
+            "classify_and_filter_jobs@1000": result(1e-3),
+            "truncate_description@1000": result(1e-3),
+        }), [])
+
+    def test_main_exits_1_on_regression(self):
+        path = os.path.join(tempfile.mkdtemp(), "baseline.json")
+        with open(path, "w", encoding="utf8") as f:
+            json.dump(BASELINE, f)
+
+        for seconds_per_row, code in [(1e-5, 0), (2e-5, 1)]:
+            results = {"clean_markdown@1000": result(seconds_per_row)}
+            with patch.object(run, "run_benchmarks", return_value=results), redirect_stdout(StringIO()):
+                self.assertEqual(run.main(["--rows", "1000", "--only", "clean_markdown", "--compare", path]), code)
+
+if __name__ == '__main__':
+    unittest.main()
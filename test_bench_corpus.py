@@ -0,0 +1,21 @@
+import unittest
+from benchmarks.corpus import generate_jobs
+
+class TestBenchCorpus(unittest.TestCase):
+
+    def test_same_seed_same_frame(self):
+        a = generate_jobs(50, description_words=80, seed=7)
+        b = generate_jobs(50, description_words=80, seed=7)
+        self.assertTrue(a.equals(b))
+        self.assertFalse(a.equals(generate_jobs(50, description_words=80, seed=8)))
+
+    def test_jobspy_shape(self):
+        df = generate_jobs(20, description_words=80, with_classification=True)
+        self.assertEqual(len(df), 20)
+        for col in ["id", "site", "title", "company", "location", "description", "date_posted",
+                    "source_query", "source_location", "role_scores", "seniority_scores", "skills", "summary"]:
+            self.assertIn(col, df.columns)
+        self.assertTrue(df["id"].is_unique)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import os
+import sys
+import tempfile
+import subprocess
+import unittest
+import pandas as pd
+import main
+from utils.scheduler import save_history
+
+class TestCli(unittest.TestCase):
+
+    def test_legacy_invocations_map_to_run(self):
+        args = main.parse_args([])
+        self.assertEqual((args.command, args.skip_scrape), ("run", False))
+
+        args = main.parse_args(["skip", "--profile", "dedupe"])
+        self.assertEqual((args.command, args.skip_scrape, args.profile), ("run", True, "dedupe"))
+
+    def test_stage_commands_take_checkpoints(self):
+        args = main.parse_args(["classify", "--input", "jobs/filtered_jobs_x.csv"])
+        self.assertEqual((args.command, args.input), ("classify", "jobs/filtered_jobs_x.csv"))
+
+    def test_history_only_for_latest_scrape_checkpoint(self):
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                save_history({"runs": 2, "cells": {}})
+                self.assertIsNotNone(main.history_for(pd.DataFrame({"scrape_run": [2, 2]})))
+                self.assertIsNone(main.history_for(pd.DataFrame({"scrape_run": [1, 1]})))
+                self.assertIsNone(main.history_for(pd.DataFrame({"id": ["a"]})))
+            finally:
+                os.chdir(cwd)
+
+    def test_import_is_lazy(self):
+        code = "import sys, main, utils.upload_jobs; print(sorted(m for m in ('pandas', 'jobspy', 'supabase') if m in sys.modules))"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "[]")
+
+if __name__ == '__main__':
+    unittest.main()
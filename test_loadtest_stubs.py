@@ -0,0 +1,41 @@
+import requests
+import unittest
+from loadtest.stubs import start_stub_worker, start_stub_postgrest
+
+class TestLoadtestStubs(unittest.TestCase):
+
+    def test_worker_returns_one_result_per_job(self):
+        server, url = start_stub_worker()
+        try:
+            jobs = [{"title": "Software Engineer Intern", "description": ""}, {"title": "UX Designer", "description": ""}]
+            data = requests.post(url, json={"jobs": jobs}, timeout=5).json()
+            self.assertEqual(len(data["results"]), 2)
+            self.assertEqual(data["results"][0]["seniority_scores"]["intern"], 1)
+        finally:
+            server.shutdown()
+
+    def test_worker_injects_failures(self):
+        server, url = start_stub_worker(error_rate=0.5, malformed_rate=0.5)
+        try:
+            for _ in range(10):
+                resp = requests.post(url, json={"jobs": [{"title": "x"}]}, timeout=5)
+                with self.assertRaises((requests.HTTPError, ValueError)):
+                    resp.raise_for_status()
+                    resp.json()
+            self.assertEqual(server.stats["errors"] + server.stats["malformed"], 10)
+        finally:
+            server.shutdown()
+
+    def test_postgrest_upsert_and_select(self):
+        server, url = start_stub_postgrest()
+        try:
+            requests.post(f"{url}/rest/v1/jobs", json=[{"id": "a", "title": "A"}, {"id": "b", "title": "B"}], timeout=5)
+            requests.post(f"{url}/rest/v1/jobs", json=[{"id": "a", "title": "A2"}], timeout=5)
+            rows = requests.get(f"{url}/rest/v1/jobs?select=id", timeout=5).json()
+            self.assertEqual(sorted(r["id"] for r in rows), ["a", "b"])
+            self.assertEqual(server.tables["jobs"]["a"]["title"], "A2")
+        finally:
+            server.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import json
+import tempfile
+import unittest
+import tracemalloc
+from utils import metrics
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        metrics.start_run("test", track_memory=True)
+
+    def tearDown(self):
+        tracemalloc.stop()
+
+    def test_stage_records_rows_and_time(self):
+        with metrics.stage("filter_title", rows_in=10) as s:
+            data = [0] * 1000
+            s["rows_out"] = 4
+
+        stage = metrics.report()["stages"][0]
+        self.assertEqual(stage["stage"], "filter_title")
+        self.assertEqual((stage["rows_in"], stage["rows_out"], stage["status"]), (10, 4, "ok"))
+        self.assertGreater(stage["seconds"], 0)
+        self.assertGreater(stage["peak_mem_bytes"], 0)
+        self.assertGreater(stage["process_max_rss_bytes"], 0)
+        self.assertGreaterEqual(stage["max_rss_growth_bytes"], 0)
+
+    def test_heap_tracing_is_opt_in(self):
+        metrics.start_run("untraced")
+        self.assertFalse(tracemalloc.is_tracing())
+        with metrics.stage("clean_markdown", rows_in=1):
+            pass
+        stage = metrics.report()["stages"][0]
+        self.assertNotIn("peak_mem_bytes", stage)
+        self.assertGreater(stage["process_max_rss_bytes"], 0)
+        self.assertGreaterEqual(stage["max_rss_growth_bytes"], 0)
+
+    def test_scrape_cells_get_yields(self):
+        metrics.record("scrape_cells", site="linkedin", location="Austin, TX", query="ux designer",
+                       status="ok", raw=50, seconds=1.0)
+        metrics.update_scrape_cells("new", {("linkedin", "Austin, TX", "ux designer"): 7})
+        metrics.update_scrape_cells("kept", {("linkedin", "Austin, TX", "ux designer"): 3})
+
+        data = metrics.report()
+        self.assertEqual((data["scrape_cells"][0]["new"], data["scrape_cells"][0]["kept"]), (7, 3))
+        self.assertEqual(data["summary"]["scrape_cells"]["new_results"], 7)
+
+    def test_failed_stage_is_recorded(self):
+        with self.assertRaises(ValueError):
+            with metrics.stage("upload"):
+                raise ValueError("boom")
+        stage = metrics.report()["stages"][0]
+        self.assertEqual(stage["status"], "error")
+        self.assertEqual(stage["error"], "boom")
+
+    def test_reports_written(self):
+        metrics.record("worker_batches", jobs=10, status="ok", seconds=0.5)
+        metrics.record("worker_batches", jobs=10, status="error", seconds=1.5)
+        with metrics.stage("classify_ai", rows_in=20):
+            pass
+
+        with tempfile.TemporaryDirectory() as tmp:
+            data = metrics.write_report(os.path.join(tmp, "run.json"))
+            with open(os.path.join(tmp, "run.json"), encoding="utf8") as f:
+                self.assertEqual(json.load(f)["summary"]["worker_batches"]["failed"], 1)
+
+            prom_path = os.path.join(tmp, "run.prom")
+            metrics.write_prometheus(prom_path, data)
+            with open(prom_path, encoding="utf8") as f:
+                prom = f.read()
+            self.assertIn('job_scraper_stage_rows_in{stage="classify_ai"} 20', prom)
+            self.assertIn("job_scraper_worker_batches_jobs 20", prom)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import random
+import pandas as pd
+import unittest
+from datetime import datetime, timedelta
+from utils.scheduler import (
+    DEFAULT_HOURS_OLD,
+    DEFAULT_RESULTS_WANTED,
+    PROBE_EVERY_RUNS,
+    plan_cells,
+    record_cell,
+    record_yields,
+    start_run,
+)
+
+CELLS = [
+    ("linkedin", "Seattle, WA", "ux designer"),
+    ("linkedin", "Redmond, WA", "illustrator"),
+    ("indeed", "Austin, TX", "full stack"),
+]
+
+
+def run_once(history, new_counts, raw=250, results_wanted=250):
+    """Simulates one scrape run where each cell yields new_counts[cell] new jobs."""
+    start_run(history)
+    rows = []
+    for (site, location, query), new in new_counts.items():
+        record_cell(history, site, location, query, results_wanted, raw)
+        rows += [{"site": site, "source_location": location, "source_query": query}] * new
+    record_yields(history, pd.DataFrame(rows, columns=["site", "source_location", "source_query"]), "new")
+
+
+class TestScheduler(unittest.TestCase):
+
+    def test_unseen_cells_get_full_budget(self):
+        plan = plan_cells({"runs": 0, "cells": {}}, CELLS)
+        self.assertEqual(len(plan), 3)
+        self.assertTrue(all(c["results_wanted"] == DEFAULT_RESULTS_WANTED for c in plan))
+        self.assertTrue(all(c["hours_old"] == DEFAULT_HOURS_OLD for c in plan))
+
+    def test_orders_by_yield_and_narrows_window(self):
+        history = {"runs": 0, "cells": {}}
+        run_once(history, {CELLS[0]: 5, CELLS[1]: 1, CELLS[2]: 40})
+
+        plan = plan_cells(history, CELLS, now=datetime.now() + timedelta(hours=11, minutes=30))
+        self.assertEqual([c["query"] for c in plan], ["full stack", "ux designer", "illustrator"])
+        self.assertTrue(all(c["results_wanted"] == DEFAULT_RESULTS_WANTED for c in plan))
+        self.assertTrue(all(c["hours_old"] == 36 for c in plan))
+
+    def test_orders_by_yield_per_hour_of_window(self):
+        history = {"runs": 0, "cells": {}}
+        start_run(history)
+        # 30 new jobs over a 30-day window vs 10 over one day
+        record_cell(history, *CELLS[0], 250, 250, hours_old=720)
+        record_cell(history, *CELLS[1], 250, 40, hours_old=24)
+        rows = ([{"site": CELLS[0][0], "source_location": CELLS[0][1], "source_query": CELLS[0][2]}] * 30
+                + [{"site": CELLS[1][0], "source_location": CELLS[1][1], "source_query": CELLS[1][2]}] * 10)
+        record_yields(history, pd.DataFrame(rows), "new")
+
+        plan = plan_cells(history, CELLS[:2])
+        self.assertEqual([c["query"] for c in plan], ["illustrator", "ux designer"])
+
+    def test_new_jobs_spread_through_results_are_kept(self):
+        # Relevance-ordered search: the day's new postings sit anywhere in the list
+        rng = random.Random(0)
+        history = {"runs": 0, "cells": {}}
+        site, location, query = CELLS[0]
+        now = datetime(2025, 1, 1)
+        found_total = new_total = 0
+
+        for _ in range(6):
+            now += timedelta(days=1)
+            ages = [rng.uniform(0, 720) for _ in range(250)]
+            plan = plan_cells(history, [CELLS[0]], now=now)[0]
+            returned = [a for a in ages if a <= plan["hours_old"]][:plan["results_wanted"]]
+            found = sum(1 for a in returned if a < 24)
+            found_total += found
+            new_total += sum(1 for a in ages if a < 24)
+
+            start_run(history)
+            record_cell(history, site, location, query, plan["results_wanted"], len(returned),
+                        plan["hours_old"], scraped_at=now)
+            rows = [{"site": site, "source_location": location, "source_query": query}] * found
+            record_yields(history, pd.DataFrame(rows, columns=["site", "source_location", "source_query"]), "new")
+
+        self.assertGreater(new_total, 0)
+        self.assertEqual(found_total, new_total)
+        self.assertEqual(plan["hours_old"], 48)
+
+    def test_recorded_yields_are_not_overwritten(self):
+        history = {"runs": 0, "cells": {}}
+        run_once(history, {CELLS[0]: 3})
+
+        # Re-filtering the same checkpoint after upload: every job now exists
+        counts = record_yields(history, pd.DataFrame(columns=["site", "source_location", "source_query"]), "new")
+        self.assertEqual(counts, {CELLS[0]: 3})
+        self.assertEqual(history["cells"]["|".join(CELLS[0])][-1]["new"], 3)
+
+    def test_window_ignores_unprocessed_scrapes(self):
+        history = {"runs": 0, "cells": {}}
+        site, location, query = CELLS[0]
+        start = datetime(2025, 1, 1)
+
+        # Scraped, but filtering failed before yields were recorded
+        start_run(history)
+        record_cell(history, site, location, query, 250, 100, scraped_at=start)
+        plan = plan_cells(history, [CELLS[0]], now=start + timedelta(days=1))
+        self.assertEqual(plan[0]["hours_old"], DEFAULT_HOURS_OLD)
+
+        record_yields(history, None, "new")
+        start_run(history)
+        record_cell(history, site, location, query, 250, 100, scraped_at=start + timedelta(days=3))
+
+        plan = plan_cells(history, [CELLS[0]], now=start + timedelta(days=4))
+        self.assertEqual(plan[0]["hours_old"], 4 * 24 + 24)
+
+    def test_budget_keeps_highest_yield(self):
+        history = {"runs": 0, "cells": {}}
+        run_once(history, {CELLS[0]: 5, CELLS[1]: 1, CELLS[2]: 40})
+
+        plan = plan_cells(history, CELLS, budget=1)
+        self.assertEqual([c["query"] for c in plan], ["full stack"])
+
+    def test_binding_budget_still_rescrapes_and_probes(self):
+        history = {"runs": 0, "cells": {}}
+        now = datetime(2025, 1, 1)
+        scraped = {cell: [] for cell in CELLS}
+
+        for run in range(1, 21):
+            now += timedelta(days=1)
+            plan = plan_cells(history, CELLS, budget=2, now=now)
+            self.assertEqual(len(plan), 2)
+
+            start_run(history)
+            rows = []
+            for c in plan:
+                cell = (c["site"], c["location"], c["query"])
+                # CELLS[1] returns nothing on its first scrape only; CELLS[2] never does
+                new = {0: 5, 1: 3 if scraped[cell] else 0, 2: 0}[CELLS.index(cell)]
+                scraped[cell].append(run)
+                record_cell(history, *cell, c["results_wanted"], 100, c["hours_old"], scraped_at=now)
+                rows += [{"site": cell[0], "source_location": cell[1], "source_query": cell[2]}] * new
+            record_yields(history, pd.DataFrame(rows, columns=["site", "source_location", "source_query"]), "new")
+
+        self.assertGreater(len(scraped[CELLS[1]]), 1)
+        dead_since = scraped[CELLS[2]][2]
+        self.assertTrue(any(r > dead_since for r in scraped[CELLS[2]]))
+
+    def test_dead_cells_skipped_then_probed(self):
+        history = {"runs": 0, "cells": {}}
+        for _ in range(3):
+            run_once(history, {CELLS[0]: 5, CELLS[1]: 0})
+
+        plan = plan_cells(history, CELLS[:2])
+        self.assertEqual([c["query"] for c in plan], ["ux designer"])
+
+        for _ in range(PROBE_EVERY_RUNS - 1):
+            run_once(history, {CELLS[0]: 5})
+
+        plan = plan_cells(history, CELLS[:2])
+        probe = [c for c in plan if c["query"] == "illustrator"]
+        self.assertEqual(len(probe), 1)
+        self.assertEqual(probe[0]["results_wanted"], DEFAULT_RESULTS_WANTED)
+
+
+if __name__ == '__main__':
+    unittest.main()
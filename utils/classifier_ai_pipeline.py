@@ -3,7 +3,9 @@ import requests
 import json
 from typing import List, Dict
 import os
+import time
 from dotenv import load_dotenv
+from utils import metrics
 
 load_dotenv()
 
@@ -52,6 +54,7 @@ def classify_jobs_ai(df: pd.DataFrame, batch_size: int = BATCH_SIZE, verbose=Tru
             for _, row in batch.iterrows()
         ]
 
+        started = time.perf_counter()
         try:
             resp = requests.post(WORKER_URL, json={"jobs": payload}, timeout=10000)
             resp.raise_for_status()
@@ -77,11 +80,20 @@ def classify_jobs_ai(df: pd.DataFrame, batch_size: int = BATCH_SIZE, verbose=Tru
                     "summary": summary,
                 })
 
+            metrics.record(
+                "worker_batches", start=start, end=end, jobs=len(payload), status="ok",
+                seconds=time.perf_counter() - started,
+            )
+
             if verbose:
                 print(f"✓ Completed batch {start}-{end}")
 
         except Exception as e:
             print(f"⚠️ Batch {start}-{end} failed: {e}")
+            metrics.record(
+                "worker_batches", start=start, end=end, jobs=len(payload), status="error",
+                error=str(e), seconds=time.perf_counter() - started,
+            )
             results.extend([
                 {
                     "role_scores": {},
@@ -0,0 +1,232 @@
+import os
+import io
+import sys
+import json
+import time
+import pstats
+import cProfile
+import platform
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROMETHEUS_PREFIX = "job_scraper"
+
+
+def _new_run(run_id=None, track_memory=False, profile_stage=None):
+    return {
+        "run_id": run_id,
+        "started_at": datetime.now().isoformat(),
+        "started": time.perf_counter(),
+        "track_memory": track_memory,
+        "profile_stage": profile_stage,
+        "stages": [],
+        "scrape_cells": [],
+        "worker_batches": [],
+        "upsert_chunks": [],
+    }
+
+
+# Current run. Recording always works, so utils modules can be used on their
+# own; main.py calls start_run() to begin a fresh report.
+_run = _new_run()
+
+
+def process_max_rss_bytes():
+    """
+    Peak resident set size of the whole process so far, or None where
+    unsupported. It never goes down, so it is not a per-stage figure.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024  # Linux reports KiB
+
+
+def start_run(run_id: str, track_memory: bool = False, profile_stage: str = None):
+    """
+    Starts a fresh run report.
+
+    Args:
+        run_id: Identifier for the run, e.g. the output file timestamp.
+        track_memory: Also record peak Python heap per stage with tracemalloc.
+            Tracing slows pure-Python stages several times over, so it is
+            off by default; RSS figures are always recorded.
+        profile_stage: Name of a stage to run under cProfile.
+    """
+    global _run
+    _run = _new_run(run_id, track_memory, profile_stage)
+    if track_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not track_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+@contextmanager
+def stage(name: str, rows_in: int = None):
+    """
+    Times a pipeline stage. Set `rows_out` on the yielded dict before leaving.
+
+        with metrics.stage("filter_title", rows_in=len(df)) as s:
+            df = classify_and_filter_jobs(df)
+            s["rows_out"] = len(df)
+    """
+    record = {"stage": name, "rows_in": rows_in, "rows_out": None, "status": "ok"}
+
+    profiler = cProfile.Profile() if _run["profile_stage"] == name else None
+    tracking = _run["track_memory"] and tracemalloc.is_tracing()
+    rss_before = process_max_rss_bytes()
+    if tracking:
+        tracemalloc.reset_peak()
+
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        yield record
+    except BaseException as e:
+        record["status"] = "error"
+        record["error"] = str(e)
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+        record["seconds"] = time.perf_counter() - start
+        rows = record["rows_in"] if record["rows_in"] is not None else record["rows_out"]
+        record["rows_per_sec"] = rows / record["seconds"] if rows and record["seconds"] > 0 else None
+        # The process peak, and how far this stage raised it
+        record["process_max_rss_bytes"] = process_max_rss_bytes()
+        record["max_rss_growth_bytes"] = (
+            record["process_max_rss_bytes"] - rss_before if rss_before is not None else None
+        )
+        if tracking:
+            record["peak_mem_bytes"] = tracemalloc.get_traced_memory()[1]
+        if profiler:
+            record["profile"] = _dump_profile(profiler, name)
+        _run["stages"].append(record)
+
+
+def _dump_profile(profiler, name):
+    path = f"./jobs/profile_{name}_{_run['run_id'] or 'adhoc'}.prof"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        profiler.dump_stats(path)
+    except OSError as e:
+        print(f"⚠️ Failed to save profile: {e}")
+        path = None
+
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(15)
+    print(f"\nProfile of stage '{name}':\n{out.getvalue()}")
+    return path
+
+
+def record(kind: str, **fields):
+    """
+    Records one event. `kind` is "scrape_cells", "worker_batches" or "upsert_chunks".
+    """
+    _run[kind].append(fields)
+
+
+def update_scrape_cells(field: str, counts: dict):
+    """
+    Copies per-cell yields (e.g. "new" or "kept" from
+    scheduler.record_yields) onto this run's scrape_cells events.
+
+    Args:
+        field: Name of the yield.
+        counts: Maps (site, location, query) to a count.
+    """
+    for e in _run["scrape_cells"]:
+        key = (e["site"], e["location"], e["query"])
+        if key in counts:
+            e[field] = counts[key]
+
+
+# -------------------------------------------
+# Reports
+# -------------------------------------------
+def _summary(events):
+    seconds = [e["seconds"] for e in events if "seconds" in e]
+    return {
+        "count": len(events),
+        "failed": sum(1 for e in events if e.get("status") == "error"),
+        "seconds_total": sum(seconds),
+        "seconds_max": max(seconds) if seconds else 0.0,
+    }
+
+
+def report() -> dict:
+    """Returns the current run as a JSON-serialisable dict."""
+    run = {k: v for k, v in _run.items() if k != "started"}
+    run["wall_seconds"] = time.perf_counter() - _run["started"]
+    run["python"] = platform.python_version()
+    run["summary"] = {
+        "scrape_cells": {
+            **_summary(_run["scrape_cells"]),
+            "raw_results": sum(e.get("raw", 0) for e in _run["scrape_cells"]),
+            "new_results": sum(e.get("new") or 0 for e in _run["scrape_cells"]),
+            "kept_results": sum(e.get("kept") or 0 for e in _run["scrape_cells"]),
+        },
+        "worker_batches": {
+            **_summary(_run["worker_batches"]),
+            "jobs": sum(e.get("jobs", 0) for e in _run["worker_batches"]),
+        },
+        "upsert_chunks": {
+            **_summary(_run["upsert_chunks"]),
+            "rows": sum(e.get("rows", 0) for e in _run["upsert_chunks"]),
+        },
+    }
+    return run
+
+
+def write_report(path: str) -> dict:
+    data = report()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(data, f, indent=2, default=str)
+    return data
+
+
+def _prom_line(name, value, labels=None):
+    label_str = ""
+    if labels:
+        pairs = ",".join(f'{k}="{str(v).replace(chr(34), chr(39))}"' for k, v in labels.items())
+        label_str = "{" + pairs + "}"
+    return f"{PROMETHEUS_PREFIX}_{name}{label_str} {value}"
+
+
+def write_prometheus(path: str, data: dict = None):
+    """
+    Writes the run as a Prometheus textfile (for node_exporter's textfile
+    collector). The file is written to a temp name and renamed into place so
+    the collector never reads a partial file.
+    """
+    data = data or report()
+    lines = [
+        _prom_line("last_run_timestamp_seconds", int(time.time())),
+        _prom_line("run_seconds", round(data["wall_seconds"], 3)),
+    ]
+    for s in data["stages"]:
+        labels = {"stage": s["stage"]}
+        lines.append(_prom_line("stage_seconds", round(s["seconds"], 3), labels))
+        lines.append(_prom_line("stage_success", int(s["status"] == "ok"), labels))
+        for key in ("rows_in", "rows_out", "process_max_rss_bytes", "max_rss_growth_bytes", "peak_mem_bytes"):
+            if s.get(key) is not None:
+                lines.append(_prom_line(f"stage_{key}", s[key], labels))
+
+    summary = data["summary"]
+    for kind, stats in summary.items():
+        for key, value in stats.items():
+            lines.append(_prom_line(f"{kind}_{key}", round(value, 3) if isinstance(value, float) else value))
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp, path)
@@ -0,0 +1,250 @@
+import os
+import json
+import math
+from datetime import datetime
+
+HISTORY_PATH = "./jobs/cell_history.json"
+
+DEFAULT_RESULTS_WANTED = 250
+DEFAULT_HOURS_OLD = 720   # full 30-day window for unseen cells
+MIN_HOURS_OLD = 24        # LinkedIn/Indeed post dates are only day-accurate
+HOURS_OLD_MARGIN = 24     # overlap with the previous scrape's window
+HISTORY_WINDOW = 8        # only the last N scrapes of a cell count
+DECAY = 0.6               # weight of each older run relative to the next one
+DEAD_AFTER_RUNS = 3       # consecutive scrapes with zero new jobs → dead cell
+PROBE_EVERY_RUNS = 5      # dead cells are re-probed this often
+STALE_SHARE = 0.25        # share of a binding budget kept for probes and least recently scraped cells
+
+
+# -------------------------------------------
+# History persistence
+# -------------------------------------------
+def cell_key(site: str, location: str, query: str) -> str:
+    return f"{site}|{location}|{query}"
+
+
+def load_history(path: str = HISTORY_PATH) -> dict:
+    """
+    Loads per-cell scrape history from JSON.
+    Returns an empty history if the file is missing or unreadable.
+    """
+    if not os.path.exists(path):
+        return {"runs": 0, "cells": {}}
+    try:
+        with open(path, encoding="utf8") as f:
+            history = json.load(f)
+        history.setdefault("runs", 0)
+        history.setdefault("cells", {})
+        return history
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"⚠️ Failed to load cell history from {path}: {e}")
+        return {"runs": 0, "cells": {}}
+
+
+def save_history(history: dict, path: str = HISTORY_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf8") as f:
+        json.dump(history, f, indent=2)
+
+
+def start_run(history: dict) -> int:
+    """Advances the run counter. Call once per scrape run, before recording cells."""
+    history["runs"] = history.get("runs", 0) + 1
+    return history["runs"]
+
+
+# -------------------------------------------
+# Recording
+# -------------------------------------------
+def record_cell(history: dict, site: str, location: str, query: str, results_wanted: int, raw: int,
+                hours_old: int = DEFAULT_HOURS_OLD, scraped_at: datetime = None):
+    """Records the raw result count of one scrape call in the current run."""
+    records = history["cells"].setdefault(cell_key(site, location, query), [])
+    records.append({
+        "run": history["runs"],
+        "scraped_at": (scraped_at or datetime.now()).isoformat(),
+        "results_wanted": results_wanted,
+        "hours_old": hours_old,
+        "raw": raw,
+        "new": None,
+        "kept": None,
+    })
+    del records[:-HISTORY_WINDOW]
+
+
+def record_yields(history: dict, df, field: str):
+    """
+    Attributes the rows of `df` back to the cells that produced them and stores
+    the per-cell counts under `field` ("new" or "kept") for the current run.
+    Cells scraped this run that produced no rows are recorded as 0.
+    Yields already recorded for the run are kept: re-running a stage on an
+    uploaded checkpoint would otherwise find every job existing and record 0.
+
+    Args:
+        history: History dict from load_history().
+        df: DataFrame with 'site', 'source_location' and 'source_query' columns.
+        field: Name of the yield to record.
+
+    Returns:
+        Dict mapping (site, location, query) to the recorded count, for every
+        cell scraped this run.
+    """
+    run = history["runs"]
+    current = {}
+    for key, records in history["cells"].items():
+        if records and records[-1]["run"] == run:
+            current[key] = records[-1]
+
+    def recorded():
+        return {tuple(key.split("|", 2)): r[field] for key, r in current.items()}
+
+    if any(r[field] is not None for r in current.values()):
+        print(f"⚠️ Cell '{field}' yields already recorded for run {run}; keeping them.")
+        return recorded()
+
+    for r in current.values():
+        r[field] = 0
+
+    if df is None or df.empty:
+        return recorded()
+
+    required = ["site", "source_location", "source_query"]
+    if any(col not in df.columns for col in required):
+        print("⚠️ Cannot attribute yields: missing source columns.")
+        return recorded()
+
+    counts = df.groupby(required).size()
+    for (site, location, query), count in counts.items():
+        record = current.get(cell_key(site, location, query))
+        if record is not None:
+            record[field] = int(count)
+    return recorded()
+
+
+# -------------------------------------------
+# Planning
+# -------------------------------------------
+def _completed(records):
+    """Records whose new-job yield is known."""
+    return [r for r in records if r.get("new") is not None]
+
+
+def expected_yield(records) -> float:
+    """
+    Decay-weighted mean of new jobs per hour of search window, most recent
+    run weighted highest. Windows vary per scrape (720h on a cell's first
+    scrape, about a day after that), so raw counts are not comparable.
+    Cells with no completed history get +inf so they are explored first.
+    """
+    done = _completed(records)
+    if not done:
+        return math.inf
+
+    total = 0.0
+    weights = 0.0
+    for age, r in enumerate(reversed(done)):
+        w = DECAY ** age
+        total += w * r["new"] / r.get("hours_old", DEFAULT_HOURS_OLD)
+        weights += w
+    return total / weights
+
+
+def is_dead(records) -> bool:
+    done = _completed(records)
+    if len(done) < DEAD_AFTER_RUNS:
+        return False
+    return all(r["new"] == 0 for r in done[-DEAD_AFTER_RUNS:])
+
+
+def hours_old_for(records, now: datetime = None) -> int:
+    """
+    Narrows the search window to postings since the cell's last processed scrape.
+
+    Search results are relevance-ordered, so new jobs are spread through the
+    whole list rather than sitting at the top; cutting results_wanted would
+    drop most of them. Cutting hours_old instead drops only postings the last
+    scrape already saw, and jobspy stops paging once the window runs out.
+
+    Scrapes whose results were never processed (new is None, e.g. a later
+    stage failed or the run was interrupted) do not count, or postings seen
+    only by them would fall outside every later window.
+    """
+    done = _completed(records)
+    if not done:
+        return DEFAULT_HOURS_OLD
+
+    now = now or datetime.now()
+    last = datetime.fromisoformat(done[-1]["scraped_at"])
+    hours = math.ceil((now - last).total_seconds() / 3600) + HOURS_OLD_MARGIN
+    return max(MIN_HOURS_OLD, min(DEFAULT_HOURS_OLD, hours))
+
+
+def plan_cells(history: dict, cells, budget: int = None, now: datetime = None):
+    """
+    Orders scrape cells by expected new-job yield and narrows each request's
+    hours_old to the time since that cell was last scraped.
+
+    Dead cells (no new jobs for DEAD_AFTER_RUNS scrapes) are skipped, except
+    for a probe every PROBE_EVERY_RUNS runs. Probes keep the full
+    results_wanted; their narrowed hours_old already bounds the cost.
+    If `budget` is given, at most that many scrape calls are planned:
+    a STALE_SHARE of the slots (at least one) goes to due probes and then
+    the least recently scraped cells, so no cell's estimate is frozen by
+    never being scraped again, and the rest go to the highest yields.
+
+    Args:
+        history: History dict from load_history().
+        cells: Iterable of (site, location, query) tuples.
+        budget: Max number of scrape calls for this run, or None for no limit.
+        now: Planning time, defaults to datetime.now().
+
+    Returns:
+        List of dicts with site, location, query, results_wanted and hours_old.
+    """
+    run = history.get("runs", 0) + 1
+    planned = []
+    skipped = 0
+
+    for site, location, query in cells:
+        records = history["cells"].get(cell_key(site, location, query), [])
+        last_run = records[-1]["run"] if records else 0
+
+        probe = is_dead(records)
+        if probe:
+            if run - last_run < PROBE_EVERY_RUNS:
+                skipped += 1
+                continue
+            score = 0.0
+        else:
+            score = expected_yield(records)
+
+        planned.append({
+            "score": score,
+            "probe": probe,
+            "last_run": last_run,
+            "cell": {
+                "site": site,
+                "location": location,
+                "query": query,
+                "results_wanted": DEFAULT_RESULTS_WANTED,
+                "hours_old": hours_old_for(records, now),
+            },
+        })
+
+    # Stable sort keeps the QUERIES/LOCATIONS order among equal scores
+    planned.sort(key=lambda p: p["score"], reverse=True)
+
+    if budget is not None and len(planned) > budget:
+        reserved = min(budget, max(1, round(budget * STALE_SHARE)))
+        stale = sorted(planned, key=lambda p: (not p["probe"], p["last_run"]))
+        chosen = {id(p) for p in stale[:reserved]}
+        for p in planned:
+            if len(chosen) >= budget:
+                break
+            chosen.add(id(p))
+        skipped += len(planned) - budget
+        planned = [p for p in planned if id(p) in chosen]
+
+    plan = [p["cell"] for p in planned]
+    print(f"✓ Planned {len(plan)} scrape calls ({skipped} cells skipped)")
+    return plan
@@ -3,6 +3,8 @@ from jobspy import scrape_jobs
 from datetime import datetime
 import time
 import hashlib
+from utils.scheduler import record_cell
+from utils import metrics
 
 QUERIES = [
     'product designer',
@@ -36,6 +38,8 @@ LOCATIONS = [
 
 SITES = ["linkedin", "indeed"]
 
+RATE_LIMIT_SECONDS = 2  # pause between scrape calls
+
 def normalize(x):
     """Safe normalize function for dedup fields."""
     if pd.isna(x):
@@ -50,41 +54,70 @@ def make_unique_id(row):
     raw = f"{title}|{company}|{location}"
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
-def scrape_all_jobs():
+def all_cells():
+    """Every (site, location, query) combination, in scrape order."""
+    return [(site, location, q) for site in SITES for location in LOCATIONS for q in QUERIES]
+
+def scrape_all_jobs(plan=None, history=None):
+    """
+    Scrapes every cell in `plan` (see utils.scheduler.plan_cells).
+    Without a plan, every cell is scraped with results_wanted=250 over 720 hours.
+    If `history` is given, the raw count of each cell is recorded into it.
+    """
+    if plan is None:
+        plan = [
+            {"site": site, "location": location, "query": q, "results_wanted": 250, "hours_old": 720}
+            for site, location, q in all_cells()
+        ]
+
     all_jobs = []
-    
-    for site in SITES:
-        for location in LOCATIONS:
-            for q in QUERIES:
-                try:
-                    print(f"\n[{site.upper()}] {location} : '{q}'...", end=" ")
-
-                    jobs = scrape_jobs(
-                        site_name=[site],
-                        search_term=q,
-                        location=location,
-                        country_indeed="USA",
-                        distance=50,
-                        results_wanted=250,
-                        hours_old=720,
-                        linkedin_fetch_description=True if site == "linkedin" else False,
-                    )
-
-                    count = len(jobs) if jobs is not None and not jobs.empty else 0
-                    print(f"✓ {count} jobs")
-
-                    if jobs is not None and not jobs.empty:
-                        jobs["scraped_at"] = datetime.now().isoformat()
-                        jobs["source_query"] = q
-                        jobs["source_location"] = location
-                        all_jobs.append(jobs)
-
-                    time.sleep(2) # Rate limiting protection
-
-                except Exception as e:
-                    print(f"✗ Error: {e}")
-                    continue
-            
+
+    for cell in plan:
+        site, location, q = cell["site"], cell["location"], cell["query"]
+        started = time.perf_counter()
+        try:
+            print(f"\n[{site.upper()}] {location} : '{q}' ({cell['results_wanted']}, {cell['hours_old']}h)...", end=" ")
+
+            jobs = scrape_jobs(
+                site_name=[site],
+                search_term=q,
+                location=location,
+                country_indeed="USA",
+                distance=50,
+                results_wanted=cell["results_wanted"],
+                hours_old=cell["hours_old"],
+                linkedin_fetch_description=True if site == "linkedin" else False,
+            )
+
+            count = len(jobs) if jobs is not None and not jobs.empty else 0
+            print(f"✓ {count} jobs")
+
+            metrics.record(
+                "scrape_cells", site=site, location=location, query=q, status="ok",
+                results_wanted=cell["results_wanted"], raw=count, seconds=time.perf_counter() - started,
+            )
+
+            if history is not None:
+                record_cell(history, site, location, q, cell["results_wanted"], count, cell["hours_old"])
+
+            if jobs is not None and not jobs.empty:
+                jobs["scraped_at"] = datetime.now().isoformat()
+                jobs["site"] = site
+                jobs["source_query"] = q
+                jobs["source_location"] = location
+                all_jobs.append(jobs)
+
+            time.sleep(RATE_LIMIT_SECONDS) # Rate limiting protection
+
+        except Exception as e:
+            print(f"✗ Error: {e}")
+            metrics.record(
+                "scrape_cells", site=site, location=location, query=q, status="error", error=str(e),
+                results_wanted=cell["results_wanted"], raw=0, seconds=time.perf_counter() - started,
+            )
+            continue
+
+
     if not all_jobs:
         return pd.DataFrame()
     
@@ -1,20 +1,39 @@
 import os
 import csv
 import json
+import time
 from dotenv import load_dotenv
-from supabase import create_client, Client
 from datetime import datetime
 from utils.markdown_cleaner import clean_markdown
+from utils import metrics
 
-load_dotenv()
+UPSERT_CHUNK_SIZE = 500  # rows per upsert request
 
-url = os.getenv("SUPABASE_URL")
-key = os.getenv("SUPABASE_KEY")
-supabase: Client = create_client(url, key)
+_supabase = None
+
+
+def get_supabase():
+    """
+    Returns the Supabase client, creating it on first use so that importing
+    this module needs neither the supabase package nor credentials.
+    """
+    global _supabase
+    if _supabase is None:
+        from supabase import create_client
+
+        load_dotenv()
+        url = os.getenv("SUPABASE_URL")
+        key = os.getenv("SUPABASE_KEY")
+        if not url or not key:
+            raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set.")
+        _supabase = create_client(url, key)
+    return _supabase
 
 
 def get_existing_job_ids():
     """Fetches all job IDs from the Supabase table."""
+    # Created outside the try: missing credentials must not read as "no existing jobs"
+    supabase = get_supabase()
     try:
         response = supabase.table("jobs").select("id").execute()
         return [job["id"] for job in response.data]
@@ -112,15 +131,31 @@ def transform_row(row, classified=True):
     return classified_job
 
 
+def upsert_records(records, chunk_size=UPSERT_CHUNK_SIZE):
+    """Upserts records into the jobs table in chunks, timing each chunk."""
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        started = time.perf_counter()
+        try:
+            get_supabase().table("jobs").upsert(chunk).execute()
+        except Exception as e:
+            metrics.record("upsert_chunks", start=start, rows=len(chunk), status="error",
+                           error=str(e), seconds=time.perf_counter() - started)
+            raise
+        metrics.record("upsert_chunks", start=start, rows=len(chunk), status="ok",
+                       seconds=time.perf_counter() - started)
+
+
 def upload_jobs_from_csv(csv_path):
+    """Upserts classified jobs from a CSV. Returns the number of rows uploaded."""
     with open(csv_path, encoding="utf8", newline="") as f:
         reader = csv.DictReader(f)
         records = [transform_row(row) for row in reader]
 
     if records:
-        supabase.table("jobs").upsert(records).execute()
+        upsert_records(records)
 
-    return True
+    return len(records)
 
 
 def upload_unclassified_jobs_df(jobs_df):
@@ -131,6 +166,6 @@ def upload_unclassified_jobs_df(jobs_df):
         records.append(transformed)
 
     if records:
-        supabase.table("jobs").upsert(records).execute()
+        upsert_records(records)
 
     return True
\ No newline at end of file